@@ -8,6 +8,11 @@ CheckAction = namedtuple("CheckAction", [])
 # we coalesce BetAction and RaiseAction for convenience
 RaiseAction = namedtuple("RaiseAction", ["amount"])
 Action = Union[FoldAction, CallAction, CheckAction, RaiseAction]
+# fold, call and check carry no data, so one shared instance of each is reused
+FOLD, CALL, CHECK = FoldAction(), CallAction(), CheckAction()
+# indexed by action code: 0 fold, 1 call, 2 check, 3 raise, as in the proto ActionType and the gym env
+ACTION_TYPES = (FoldAction, CallAction, CheckAction, RaiseAction)
+ACTION_SINGLETONS = (FOLD, CALL, CHECK)  # same codes, for the actions without an amount
 TerminalState = namedtuple("TerminalState", ["deltas", "previous_state"])
 
 STREET_NAMES = ["Preflop", "Flop", "River"]
@@ -6,7 +6,14 @@ import sys
 import time
 from typing import Deque, List, Optional
 
-from .actions import Action, CallAction, CheckAction, FoldAction, RaiseAction
+from .actions import (
+    ACTION_SINGLETONS,
+    Action,
+    CallAction,
+    CheckAction,
+    FoldAction,
+    RaiseAction,
+)
 from .config import (
     CONNECT_TIMEOUT,
     CONNECT_RETRIES,
@@ -14,6 +21,7 @@ from .config import (
     READY_CHECK_RETRIES,
     ACTION_REQUEST_TIMEOUT,
     ACTION_REQUEST_RETRIES,
+    RETRY_INITIAL_BACKOFF,
     ENFORCE_GAME_CLOCK,
     STARTING_GAME_CLOCK,
     PLAYER_LOG_SIZE_LIMIT,
@@ -32,6 +40,64 @@ from shared.pokerbot_pb2 import (  # noqa: E402
 )
 
 
+def _method_config(method: Optional[str], backoff: float, attempts: int) -> dict:
+    """
+    Builds a service config entry retrying one PokerBot method (or all of them) on UNAVAILABLE.
+
+    Args:
+        method (Optional[str]): The RPC name, or None for the service-wide default.
+        backoff (float): The longest wait between attempts, in seconds.
+        attempts (int): The total number of attempts allowed.
+
+    Returns:
+        dict: The methodConfig entry.
+    """
+    name = {"service": "poker.PokerBot"}
+    if method is not None:
+        name["method"] = method
+    method_config = {"name": [name]}
+    if attempts > 1:  # gRPC rejects retry policies with fewer than two attempts
+        # start short and double up to the configured wait; gRPC jitters every backoff
+        max_backoff = max(backoff, 0.001)
+        method_config["retryPolicy"] = {
+            "maxAttempts": attempts,
+            "initialBackoff": f"{min(RETRY_INITIAL_BACKOFF, max_backoff)}s",
+            "maxBackoff": f"{max_backoff}s",
+            "backoffMultiplier": 2,
+            "retryableStatusCodes": ["UNAVAILABLE"],
+        }
+    return method_config
+
+
+# one channel serves the whole match, so each RPC keeps its own retry policy;
+# the options are the same for every client and are built once at import
+_SERVICE_CONFIG = json.dumps(
+    {
+        "methodConfig": [
+            _method_config(None, CONNECT_TIMEOUT, CONNECT_RETRIES),
+            _method_config("ReadyCheck", READY_CHECK_TIMEOUT, READY_CHECK_RETRIES),
+            _method_config("RequestAction", ACTION_REQUEST_TIMEOUT, ACTION_REQUEST_RETRIES),
+        ]
+    }
+)
+_CHANNEL_OPTIONS = (
+    ("grpc.enable_retries", 1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.lb_policy_name", "round_robin"),
+    # requests are small and strictly turn-based, so favour latency over batching
+    ("grpc.optimization_target", "latency"),
+    ("grpc.service_config", _SERVICE_CONFIG),
+)
+
+# the amount-free actions always encode the same way; request fields copy them, so they are shared
+_PROTO_ACTIONS = {
+    FoldAction: ProtoAction(action=ActionType.FOLD),
+    CallAction: ProtoAction(action=ActionType.CALL),
+    CheckAction: ProtoAction(action=ActionType.CHECK),
+}
+
+
 class Client:
     """
     Handles interactions with one player's pokerbot within the Kubernetes cluster,
@@ -58,73 +124,71 @@ class Client:
         self.stub = None
         self.log = deque()
         self.log_size = 0
+        self.channel_ready = None
 
-        self._connect_with_retries()
+        self._open_channel()
 
-    def _connect_with_retries(self) -> None:
+    def _open_channel(self) -> None:
         """
-        Establishes a connection to the gRPC server with retries.
+        Opens the gRPC channel and starts connecting in the background,
+        so several bots can connect at once; call wait_for_connection before the first request.
         """
-        retry_options = {
-            "initial_backoff_ms": CONNECT_TIMEOUT * 1000,
-            "max_backoff_ms": CONNECT_TIMEOUT * 1000,
-            "max_attempts": CONNECT_RETRIES,
-            "retry_codes": [grpc.StatusCode.UNAVAILABLE.value],
-        }
-        channel_options = [
-            ("grpc.enable_retries", 1),
-            ("grpc.max_receive_message_length", -1),
-            ("grpc.max_send_message_length", -1),
-            ("grpc.lb_policy_name", "round_robin"),
-            ("grpc.service_config", json.dumps({"retryPolicy": retry_options})),
-        ]
         self.channel = grpc.insecure_channel(
-            self.service_dns_name, options=channel_options
+            self.service_dns_name, options=_CHANNEL_OPTIONS
         )
         self.stub = PokerBotStub(self.channel)
+        self.channel_ready = grpc.channel_ready_future(self.channel)
 
+    def wait_for_connection(self) -> None:
+        """
+        Waits until the channel opened at construction is connected to the gRPC server.
+        """
         try:
-            grpc.channel_ready_future(self.channel).result()
+            self.channel_ready.result()
             print(f"Connected to {self.service_dns_name}")
         except grpc.FutureTimeoutError:
             raise RuntimeError(
                 f"Failed to connect to {self.service_dns_name} after {CONNECT_RETRIES} attempts"
             )
 
-    def check_ready(self, player_names: List[str]) -> bool:
+    def close(self) -> None:
+        """
+        Closes the gRPC channel to the pokerbot once the match is over.
+        """
+        if self.channel is not None:
+            self.channel.close()
+            self.channel = None
+            self.stub = None
+
+    def send_ready_check(self, player_names: List[str]) -> grpc.Future:
         """
-        Sends a readiness check to the pokerbot to verify if it is ready to start or continue the game.
+        Sends a readiness check to the pokerbot without waiting for the reply,
+        so both bots can be checked at once; pass the returned future to check_ready.
 
         Args:
             player_names (List[str]): A list of player names participating in the game.
 
+        Returns:
+            grpc.Future: The pending ReadyCheck call.
+        """
+        request = ReadyCheckRequest(player_names=player_names)
+        return self.stub.ReadyCheck.future(request)
+
+    def check_ready(self, ready_check_call: grpc.Future) -> bool:
+        """
+        Waits for a pending readiness check to verify if the bot is ready to start or continue the game.
+
+        Args:
+            ready_check_call (grpc.Future): The future returned by send_ready_check.
+
         Returns:
             bool: True if the bot is ready, False otherwise.
         """
-        retry_options = {
-            "initial_backoff_ms": READY_CHECK_TIMEOUT * 1000,
-            "max_backoff_ms": READY_CHECK_TIMEOUT * 1000,
-            "max_attempts": READY_CHECK_RETRIES,
-            "retry_codes": [grpc.StatusCode.UNAVAILABLE.value],
-        }
-        channel_options = [
-            ("grpc.enable_retries", 1),
-            ("grpc.max_receive_message_length", -1),
-            ("grpc.max_send_message_length", -1),
-            ("grpc.lb_policy_name", "round_robin"),
-            ("grpc.service_config", json.dumps({"retryPolicy": retry_options})),
-        ]
-        with grpc.insecure_channel(
-            self.service_dns_name, options=channel_options
-        ) as channel:
-            stub = PokerBotStub(channel)
-            request = ReadyCheckRequest(player_names=player_names)
-            try:
-                response = stub.ReadyCheck(request)
-                return response.ready
-            except grpc.RpcError as e:
-                print(f"Bot {self.name} is not ready: {e}")
-                return False
+        try:
+            return ready_check_call.result().ready
+        except grpc.RpcError as e:
+            print(f"Bot {self.name} is not ready: {e}")
+            return False
 
     def request_action(
         self, player_hand: List[str], board_cards: List[str], new_actions: Deque[Action]
@@ -141,50 +205,36 @@ class Client:
         Returns:
             Optional[Action]: The action decided by the pokerbot, or None if an error occurred.
         """
-        retry_options = {
-            "initial_backoff_ms": ACTION_REQUEST_TIMEOUT * 1000,
-            "max_backoff_ms": ACTION_REQUEST_TIMEOUT * 1000,
-            "max_attempts": ACTION_REQUEST_RETRIES,
-            "retry_codes": [grpc.StatusCode.UNAVAILABLE.value],
-        }
-        channel_options = [
-            ("grpc.enable_retries", 1),
-            ("grpc.max_receive_message_length", -1),
-            ("grpc.max_send_message_length", -1),
-            ("grpc.lb_policy_name", "round_robin"),
-            ("grpc.service_config", json.dumps({"retryPolicy": retry_options})),
-        ]
-        with grpc.insecure_channel(
-            self.service_dns_name, options=channel_options
-        ) as channel:
-            stub = PokerBotStub(channel)
-            proto_actions = self._convert_actions_to_proto(new_actions)
-
-            request = ActionRequest(
-                game_clock=self.game_clock,
-                player_hand=player_hand,
-                board_cards=board_cards,
-                new_actions=proto_actions,
-            )
-
-            start_time = time.perf_counter()
+        proto_actions = self._convert_actions_to_proto(new_actions)
 
-            try:
-                response = stub.RequestAction(request)
-                action = self._convert_proto_to_action(response.action)
-            except grpc.RpcError as e:
-                print(f"An error occurred: {e}")
-                action = None
+        request = ActionRequest(
+            game_clock=self.game_clock,
+            player_hand=player_hand,
+            board_cards=board_cards,
+            new_actions=proto_actions,
+        )
 
-            end_time = time.perf_counter()
-            duration = end_time - start_time
+        # the remaining clock doubles as the RPC deadline, so a stalled bot is cut off by gRPC
+        # instead of being waited on indefinitely and charged afterwards
+        timeout = self.game_clock if ENFORCE_GAME_CLOCK else None
+        start_time = time.perf_counter()
 
-            if ENFORCE_GAME_CLOCK:
-                self.game_clock -= duration
-            if self.game_clock <= 0:
+        try:
+            response = self.stub.RequestAction(request, timeout=timeout)
+            action = self._convert_proto_to_action(response.action)
+        except grpc.RpcError as e:
+            if ENFORCE_GAME_CLOCK and e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                self.game_clock = 0
                 raise TimeoutError("Game clock has run out")
+            print(f"An error occurred: {e}")
+            action = None
+
+        if ENFORCE_GAME_CLOCK:
+            self.game_clock -= time.perf_counter() - start_time
+        if self.game_clock <= 0:
+            raise TimeoutError("Game clock has run out")
 
-            return action
+        return action
 
     def end_round(
         self,
@@ -194,9 +244,11 @@ class Client:
         new_actions: Deque[Action],
         delta: int,
         is_match_over: bool,
-    ) -> None:
+    ) -> grpc.Future:
         """
         Signals the end of a round to the pokerbot, including the final state of the game and whether the match is over.
+        The call is sent without waiting for the reply, so both bots can be notified at once;
+        pass the returned future to collect_logs.
 
         Args:
             player_hand (List[str]): The final hand of the player.
@@ -205,6 +257,9 @@ class Client:
             new_actions (Deque[Action]): Any actions that occurred after the last action request.
             delta (int): The change in the player's bankroll after the round.
             is_match_over (bool): Indicates whether the match has concluded.
+
+        Returns:
+            grpc.Future: The pending EndRound call.
         """
         proto_actions = self._convert_actions_to_proto(new_actions)
 
@@ -216,9 +271,17 @@ class Client:
             delta=delta,
             is_match_over=is_match_over,
         )
+        return self.stub.EndRound.future(end_round_message)
 
+    def collect_logs(self, end_round_call: grpc.Future) -> None:
+        """
+        Waits for a pending EndRound call and keeps the logs it returned, up to PLAYER_LOG_SIZE_LIMIT bytes.
+
+        Args:
+            end_round_call (grpc.Future): The future returned by end_round.
+        """
         try:
-            new_logs = self.stub.EndRound(end_round_message).logs
+            new_logs = end_round_call.result().logs
             for log_entry in new_logs:
                 entry_bytes = log_entry.encode("utf-8")
                 entry_size = len(entry_bytes)
@@ -247,11 +310,11 @@ class Client:
             List[ProtoAction]: The list of converted protobuf Action messages.
         """
         proto_actions = []
-        while actions:
-            action = actions.popleft()
+        for action in actions:
             proto_action = self._convert_action_to_proto(action)
-            if proto_action:
+            if proto_action is not None:
                 proto_actions.append(proto_action)
+        actions.clear()
         return proto_actions
 
     @staticmethod
@@ -265,14 +328,11 @@ class Client:
         Returns:
             Optional[Action]: The converted Python-native Action object, or None if conversion is not possible.
         """
-        if proto_action.action == ActionType.FOLD:
-            return FoldAction()
-        elif proto_action.action == ActionType.CALL:
-            return CallAction()
-        elif proto_action.action == ActionType.CHECK:
-            return CheckAction()
-        elif proto_action.action == ActionType.RAISE:
+        action_code = proto_action.action
+        if action_code == ActionType.RAISE:
             return RaiseAction(amount=proto_action.amount)
+        elif 0 <= action_code < ActionType.RAISE:
+            return ACTION_SINGLETONS[action_code]
         else:
             return None
 
@@ -287,13 +347,7 @@ class Client:
         Returns:
             Optional[ProtoAction]: The converted protobuf Action message, or None if conversion is not applicable.
         """
-        if isinstance(action, FoldAction):
-            return ProtoAction(action=ActionType.FOLD)
-        elif isinstance(action, CallAction):
-            return ProtoAction(action=ActionType.CALL)
-        elif isinstance(action, CheckAction):
-            return ProtoAction(action=ActionType.CHECK)
-        elif isinstance(action, RaiseAction):
+        kind = type(action)
+        if kind is RaiseAction:
             return ProtoAction(action=ActionType.RAISE, amount=action.amount)
-        else:
-            return None
+        return _PROTO_ACTIONS.get(kind)
@@ -36,6 +36,7 @@ READY_CHECK_TIMEOUT = 0
 READY_CHECK_RETRIES = 1
 ACTION_REQUEST_TIMEOUT = 2
 ACTION_REQUEST_RETRIES = 2
+RETRY_INITIAL_BACKOFF = 0.25  # retries back off exponentially from here up to the timeouts above
 ENFORCE_GAME_CLOCK = True
 STARTING_GAME_CLOCK = 300.0
 
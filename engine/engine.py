@@ -3,11 +3,15 @@ CMU Poker Bot Competition Game Engine 2024
 """
 
 from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 import os
 from typing import Deque, List
 import csv
 
 from .actions import (
+    CALL,
+    CHECK,
+    FOLD,
     STREET_NAMES,
     Action,
     CallAction,
@@ -35,6 +39,13 @@ from .evaluate import ShortDeck
 from .client import Client
 from .roundstate import RoundState
 
+# game log and csv wording for the actions without an amount
+_ACTION_LOG_WORDS = {
+    FoldAction: ("folds", "fold"),
+    CallAction: ("calls", "call"),
+    CheckAction: ("checks", "check"),
+}
+
 
 class Game:
     """
@@ -60,6 +71,9 @@ class Game:
             ]
         ]
         self.new_actions: List[Deque[Action]] = [deque(), deque()]
+        self.csv_hands: List[str] = ["", ""]
+        # one deck serves every round; shuffle() also rewinds its dealing cursor
+        self.deck = ShortDeck()
         self.round_num = 0
 
     def log_round_state(self, round_state: RoundState):
@@ -87,15 +101,11 @@ class Game:
         """
         Logs an action taken by a player.
         """
-        if isinstance(action, FoldAction):
-            self.log.append(f"{player_name} folds")
-            self._create_csv_row(round_state, player_name, "fold", None)
-        elif isinstance(action, CallAction):
-            self.log.append(f"{player_name} calls")
-            self._create_csv_row(round_state, player_name, "call", None)
-        elif isinstance(action, CheckAction):
-            self.log.append(f"{player_name} checks")
-            self._create_csv_row(round_state, player_name, "check", None)
+        words = _ACTION_LOG_WORDS.get(type(action))
+        if words is not None:
+            log_word, csv_word = words
+            self.log.append(f"{player_name} {log_word}")
+            self._create_csv_row(round_state, player_name, csv_word, None)
         else:  # isinstance(action, RaiseAction)
             self.log.append(f"{player_name} bets {str(action.amount)}")
             self._create_csv_row(round_state, player_name, "bets", action.amount)
@@ -117,11 +127,14 @@ class Game:
         """
         Runs one round of poker (1 hand).
         """
-        pips = [SMALL_BLIND, BIG_BLIND]
-        stacks = [STARTING_STACK - SMALL_BLIND, STARTING_STACK - BIG_BLIND]
-        deck = ShortDeck()
+        pips = (SMALL_BLIND, BIG_BLIND)
+        stacks = (STARTING_STACK - SMALL_BLIND, STARTING_STACK - BIG_BLIND)
+        deck = self.deck
         deck.shuffle()
         hands = [deck.deal(2), deck.deal(2)]
+        # every csv row of the round repeats both hands, so they are joined once per round
+        team_hands = hands if self.round_num % 2 == 1 else hands[::-1]
+        self.csv_hands = [" ".join(hand) for hand in team_hands]
 
         round_state = RoundState(0, 0, pips, stacks, hands, [], deck, None)
         self.new_actions = [deque(), deque()]
@@ -134,7 +147,7 @@ class Game:
 
             if player.game_clock <= 0:
                 self.log.append(f"{player.name} ran out of time.")
-                action = FoldAction()
+                action = FOLD
             else:
                 try:
                     action = player.request_action(
@@ -142,11 +155,11 @@ class Game:
                     )
                 except TimeoutError:
                     self.log.append(f"{player.name} timed out.")
-                    action = FoldAction()
+                    action = FOLD
                 except Exception as e:
                     player.log.append(f"{[player.name]} raised an exception: {e}")
                     self.log.append(f"{player.name} raised an exception.")
-                    action = FoldAction()
+                    action = FOLD
 
             action = self._validate_action(action, round_state, player.name)
             self.log_action(player.name, action, round_state)
@@ -155,7 +168,8 @@ class Game:
             round_state = round_state.proceed(action)
 
         board = round_state.previous_state.board
-        for index, (player, delta) in enumerate(zip(self.players, round_state.deltas)):
+        # notify both bots before waiting on either, so the two EndRound calls overlap
+        end_round_calls = [
             player.end_round(
                 hands[index],
                 hands[1 - index],
@@ -164,6 +178,10 @@ class Game:
                 delta,
                 last_round,
             )
+            for index, (player, delta) in enumerate(zip(self.players, round_state.deltas))
+        ]
+        for player, delta, end_round_call in zip(self.players, round_state.deltas, end_round_calls):
+            player.collect_logs(end_round_call)
             player.bankroll += delta
         self.log_terminal_state(round_state)
 
@@ -176,10 +194,17 @@ class Game:
             Client(PLAYER_1_NAME, PLAYER_1_DNS),
             Client(PLAYER_2_NAME, PLAYER_2_DNS),
         ]
+        # both clients are already connecting, so the bots come up in parallel
+        for player in self.players:
+            player.wait_for_connection()
         player_names = [PLAYER_1_NAME, PLAYER_2_NAME]
 
         print("Checking ready...")
-        ready = [player.check_ready(player_names) for player in self.players]
+        # both checks are in flight before either is awaited
+        ready_check_calls = [player.send_ready_check(player_names) for player in self.players]
+        ready = [
+            player.check_ready(call) for player, call in zip(self.players, ready_check_calls)
+        ]
         if not all(ready):
             print("One or more bots are not ready. Aborting the match.")
             self.log.append("One or more bots are not ready. Aborting the match.")
@@ -202,27 +227,45 @@ class Game:
                 self.log.append(f"\nRound #{self.round_num}")
 
                 self.run_round((self.round_num == NUM_ROUNDS))
-                self.players = self.players[::-1]  # Alternate the dealer
+                self.players.reverse()  # Alternate the dealer
 
         self.log.append(f"{self.original_players[0].name} Bankroll: {self.original_players[0].bankroll}")
         self.log.append(f"{self.original_players[1].name} Bankroll: {self.original_players[1].bankroll}")
 
-        self._finalize_log()
-        add_match_entry(self.original_players[0].bankroll, self.original_players[1].bankroll)
+        for player in self.players:
+            player.close()
+
+        # the log uploads and the match entry are independent network calls, so they run side by side
+        with ThreadPoolExecutor() as executor:
+            pending = self._finalize_log(executor)
+            pending.append(
+                executor.submit(
+                    add_match_entry,
+                    self.original_players[0].bankroll,
+                    self.original_players[1].bankroll,
+                )
+            )
+            for future in pending:
+                future.result()
 
-    def _finalize_log(self) -> None:
+    def _finalize_log(self, executor: Executor) -> List[Future]:
         """
         Finalizes the game log, writing it to a file and uploading it.
+        Each file is stored on the given executor; the returned futures finish when they are.
         """
         csv_filename = f"{GAME_LOG_FILENAME}.csv"
-        self._upload_or_write_file(self.csvlog, csv_filename, is_csv=True)
+        pending = [
+            executor.submit(self._upload_or_write_file, self.csvlog, csv_filename, is_csv=True)
+        ]
 
         log_filename = f"{GAME_LOG_FILENAME}.txt"
-        self._upload_or_write_file(self.log, log_filename)
+        pending.append(executor.submit(self._upload_or_write_file, self.log, log_filename))
 
         for player in self.players:
             log_filename = os.path.join(player.name, f"{BOT_LOG_FILENAME}.txt")
-            self._upload_or_write_file(player.log, log_filename)
+            pending.append(executor.submit(self._upload_or_write_file, player.log, log_filename))
+
+        return pending
 
     def _upload_or_write_file(self, content, base_filename, is_csv=False):
         filename = self._get_unique_filename(base_filename)
@@ -278,7 +321,7 @@ class Game:
                 return action
             elif CallAction in legal_actions and amount >= continue_cost:
                 self.log.append(f"{player_name} attempted illegal RaiseAction with amount {amount}")
-                return CallAction()
+                return CALL
             else:
                 self.log.append(f"{player_name} attempted illegal RaiseAction with amount {amount}")
         elif type(action) in legal_actions:
@@ -286,7 +329,7 @@ class Game:
         else:
             self.log.append(f"{player_name} attempted illegal {type(action).__name__}")
 
-        return CheckAction() if CheckAction in legal_actions else FoldAction()
+        return CHECK if CheckAction in legal_actions else FOLD
 
     def _create_csv_row(
         self, round_state: RoundState, player_name: str, action: str, action_amt: int
@@ -297,8 +340,8 @@ class Game:
             player_name,
             action,
             action_amt if action_amt else "",
-            " ".join(round_state.hands[0] if self.round_num % 2 == 1 else round_state.hands[1]),
-            " ".join(round_state.hands[1] if self.round_num % 2 == 1 else round_state.hands[0]),
+            self.csv_hands[0],
+            self.csv_hands[1],
             " ".join(round_state.board),
             self.original_players[0].bankroll,
         ])
@@ -20,23 +20,38 @@ TOTAL: 17550 combos
 """
 
 from random import shuffle
-from typing import List
-from itertools import combinations
+from typing import List, Tuple
+from itertools import combinations, permutations
+
+_SHORT_DECK_CARDS = tuple(f"{rank}{suit}" for rank in "123456789" for suit in "shd")
 
 
 class ShortDeck:
     """Custom deck for the poker variant with cards ranked 1 to 9 across 3 suits."""
 
     def __init__(self):
-        self.cards = [f"{rank}{suit}" for rank in "123456789" for suit in "shd"]
+        self.cards = list(_SHORT_DECK_CARDS)
+        self.top = 0  # index of the next card to deal; dealing never mutates cards
 
     def shuffle(self):
         """Shuffles the deck."""
         shuffle(self.cards)
+        self.top = 0
 
     def deal(self, n):
         """Deals n cards from the deck."""
-        return [self.cards.pop() for _ in range(n)]
+        cards = self.cards[self.top : self.top + n]
+        self.top += n
+        return cards
+
+    def arrange(self, order):
+        """Puts the deck in the given order of card indices, e.g. a pre-shuffled permutation."""
+        self.cards = [_SHORT_DECK_CARDS[index] for index in order]
+        self.top = 0
+
+    def remaining(self):
+        """Returns the cards that have not been dealt yet."""
+        return self.cards[self.top :]
 
 
 def is_straight_flush(hand: List[str]) -> bool:
@@ -102,8 +117,8 @@ def find_straight(hand: List[str]) -> List[str]:
         return s2
 
 
-def evaluate(hand: List[str], board: List[str]) -> int:
-    combined_hand = sorted(hand + board, key=lambda x: int(x[0]), reverse=True)
+def _score(cards: List[str]) -> int:
+    combined_hand = sorted(cards, key=lambda x: int(x[0]), reverse=True)
     if is_straight_flush(combined_hand):
         return 80000 + high_card_value(combined_hand)
     elif is_trips(combined_hand):
@@ -120,3 +135,72 @@ def evaluate(hand: List[str], board: List[str]) -> int:
         return 20000 + frequent_card_value(combined_hand)
     else:
         return 10000 + high_card_value(combined_hand)
+
+
+# Every showdown scores exactly 4 cards out of a 27 card deck, so all 17550
+# combos are scored once at import and looked up by the bitmask of their cards.
+CARD_BITS = {card: 1 << index for index, card in enumerate(_SHORT_DECK_CARDS)}
+HAND_RANKS = {
+    sum(CARD_BITS[card] for card in combo): _score(list(combo))
+    for combo in combinations(CARD_BITS, 4)
+}
+
+
+def card_mask(cards: List[str]) -> int:
+    """Returns the bitmask of the given cards, as used to key HAND_RANKS."""
+    mask = 0
+    for card in cards:
+        mask |= CARD_BITS[card]
+    return mask
+
+
+def evaluate(hand: List[str], board: List[str]) -> int:
+    """
+    Scores the cards in hand + board. Showdowns (4 cards) come straight from the precomputed table;
+    any other number of cards, e.g. preflop or on the flop, is scored directly.
+    """
+    key = 0
+    for card in hand:
+        key |= CARD_BITS[card]
+    for card in board:
+        key |= CARD_BITS[card]
+    score = HAND_RANKS.get(key)
+    return score if score is not None else _score(hand + board)
+
+
+def equity(hand: List[str], board: List[str]) -> float:
+    """
+    Returns hand's share of the pot against every opponent hand and runout of the remaining deck,
+    counting ties as half. Runouts are scored as bitmask lookups, so this replaces rollout loops
+    over evaluate.
+    """
+    known = card_mask(hand) | card_mask(board)
+    unseen = [bit for bit in CARD_BITS.values() if not bit & known]
+    wins = total = 0
+    for runout in combinations(unseen, 2 - len(board)):
+        runout_mask = sum(runout)
+        score = HAND_RANKS[known | runout_mask]
+        board_mask = runout_mask | known & ~card_mask(hand)
+        live = [bit for bit in unseen if not bit & runout_mask]
+        for opp0, opp1 in combinations(live, 2):
+            opp_score = HAND_RANKS[board_mask | opp0 | opp1]
+            wins += (score > opp_score) * 2 + (score == opp_score)
+            total += 2
+    return wins / total
+
+
+_SUIT_RELABELINGS = [dict(zip("shd", suits)) for suits in permutations("shd")]
+
+
+def canonical_key(hand: List[str], board: List[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Returns the same key for every suit relabeling of hand + board. Suits are symmetric,
+    so these all share one equity, and tables keyed by this are up to 6 times smaller.
+    """
+    return min(
+        (
+            tuple(sorted(card[0] + suits[card[1]] for card in hand)),
+            tuple(sorted(card[0] + suits[card[1]] for card in board)),
+        )
+        for suits in _SUIT_RELABELINGS
+    )
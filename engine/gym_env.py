@@ -6,8 +6,11 @@ import gymnasium as gym
 from gymnasium import spaces
 from collections import deque
 from .actions import (
+    ACTION_SINGLETONS,
+    ACTION_TYPES,
+    CHECK,
+    FOLD,
     Action,
-    CallAction,
     CheckAction,
     FoldAction,
     RaiseAction,
@@ -27,6 +30,24 @@ def card_to_int(card: str):
     suit = {"s": 0, "h": 1, "d": 2}[suit]
     return (suit * 10 + int(rank))
 
+# observations convert every visible card on every step, so the 27 codes are computed once
+_CARD_INTS = {card: card_to_int(card) for card in ShortDeck().cards}
+
+# RoundState.legal_actions returns one of a few shared frozensets, so each one's
+# 0/1 vector (ordered by ACTION_TYPES) is built once and copied into observations
+_LEGAL_ACTION_MASKS = {}
+
+def legal_action_mask(legal_actions) -> np.ndarray:
+    mask = _LEGAL_ACTION_MASKS.get(legal_actions)
+    if mask is None:
+        mask = np.array([int(action in legal_actions) for action in ACTION_TYPES], dtype=np.int8)
+        _LEGAL_ACTION_MASKS[legal_actions] = mask
+    return mask.copy()
+
+# decks are shuffled in batches of at most this many, so the batch stays small for long games
+# and leftover decks carry over to the next game instead of being reshuffled on every reset
+_DECK_BATCH_SIZE = 1024
+
 class PokerEnv(gym.Env):
     """
     Manages logging and the high-level game procedure.
@@ -74,6 +95,8 @@ class PokerEnv(gym.Env):
         self.curr_round_num = 1
         self.player_last_actions = [None, None]
         self.opp_bot = opp_bot
+        self.deck_orders = None
+        self.deck_order_index = 0
 
     def _get_observation(self, player_num: int, opp_shown_card=None):
         """
@@ -88,19 +111,19 @@ class PokerEnv(gym.Env):
         min_raise, max_raise = round_state.raise_bounds()
         my_bankroll = self.bankrolls[player_num]
         if opp_shown_card is not None:
-            opp_shown_card = [card_to_int(card) for card in opp_shown_card]
+            opp_shown_card = [_CARD_INTS[card] for card in opp_shown_card]
         else:
             opp_shown_card = [0, 0]
 
-        board_cards = [card_to_int(card) for card in round_state.board]
+        board_cards = [_CARD_INTS[card] for card in round_state.board]
         padding = [0] * (2 - len(board_cards))
         board_cards += padding
 
         obs = {
             "is_my_turn": int(round_state.button % 2 == player_num),
-            "legal_actions": np.array([int(action in legal_actions) for action in [FoldAction, CallAction, CheckAction, RaiseAction]]).astype(np.int8),
+            "legal_actions": legal_action_mask(legal_actions),
             "street": round_state.street,
-            "my_cards": np.array([card_to_int(card) for card in round_state.hands[player_num]]),
+            "my_cards": np.array([_CARD_INTS[card] for card in round_state.hands[player_num]]),
             "board_cards": np.array(board_cards),
             "my_pip": np.array(my_pip).reshape(1,),
             "opp_pip": np.array(opp_pip).reshape(1,),
@@ -131,7 +154,7 @@ class PokerEnv(gym.Env):
             if self.player_last_actions[player_num] != FoldAction:
                 opp_shown_cards.append(round_state.previous_state.hands[1 - player_num])
 
-        return (self._get_observation(0, opp_shown_cards[0]), self._get_observation(1, opp_shown_cards[1])), tuple(round_state.deltas), was_last_round, False, {"mode": self.game_mode}
+        return (self._get_observation(0, opp_shown_cards[0]), self._get_observation(1, opp_shown_cards[1])), round_state.deltas, was_last_round, False, {"mode": self.game_mode}
 
     def _step_without_opp(self, action):
         """
@@ -142,7 +165,7 @@ class PokerEnv(gym.Env):
         if action_type == 3:
             action = RaiseAction(amount)
         else:
-            action = [FoldAction(), CallAction(), CheckAction()][action_type]
+            action = ACTION_SINGLETONS[action_type]
         action = self._validate_action(action, self.curr_round_state, active)
         self.player_last_actions[active] = action
         self.curr_round_state = self.curr_round_state.proceed(action)
@@ -174,11 +197,10 @@ class PokerEnv(gym.Env):
         Resets the round.
         """
         
-        # Shuffle the deck and deal the hands
-        pips = [SMALL_BLIND, BIG_BLIND]
-        stacks = [STARTING_STACK - SMALL_BLIND, STARTING_STACK - BIG_BLIND]
-        deck = ShortDeck()
-        deck.shuffle()
+        # Take the next shuffled deck and deal the hands
+        pips = (SMALL_BLIND, BIG_BLIND)
+        stacks = (STARTING_STACK - SMALL_BLIND, STARTING_STACK - BIG_BLIND)
+        deck = self._next_deck()
         hands = [deck.deal(2), deck.deal(2)]
 
         self.curr_round_state = RoundState(0, 0, pips, stacks, hands, [], deck, None)
@@ -186,10 +208,29 @@ class PokerEnv(gym.Env):
 
         return (self._get_observation(0), self._get_observation(1))
 
+    def _next_deck(self) -> ShortDeck:
+        """
+        Returns a shuffled deck, shuffling up to _DECK_BATCH_SIZE decks at a time with self.np_random.
+        """
+        deck = ShortDeck()
+        if self.deck_orders is None or self.deck_order_index == len(self.deck_orders):
+            # _end_round also deals a round after the last one, hence the + 1
+            batch_size = min(self.num_rounds + 1, _DECK_BATCH_SIZE)
+            orders = np.tile(np.arange(len(deck.cards), dtype=np.int8), (batch_size, 1))
+            self.deck_orders = self.np_random.permuted(orders, axis=1)
+            self.deck_order_index = 0
+        deck.arrange(self.deck_orders[self.deck_order_index].tolist())
+        self.deck_order_index += 1
+        return deck
+
     def reset(self, seed=None, options=None):
         """
         Resets the entire game.
         """
+        super().reset(seed=seed)
+        if seed is not None:
+            # decks shuffled before reseeding must not leak into the seeded game
+            self.deck_orders = None
         self.bankrolls = [0, 0]
         self.curr_round_num = 1
         obs1, obs2 = self._reset_round()
@@ -232,4 +273,4 @@ class PokerEnv(gym.Env):
         else:
             print(f"Player {player_name} attempted illegal {type(action).__name__}")
 
-        return CheckAction() if CheckAction in legal_actions else FoldAction()
+        return CHECK if CheckAction in legal_actions else FOLD
@@ -1,5 +1,4 @@
-from collections import namedtuple
-from typing import Set, Type
+from typing import FrozenSet, List, Optional, Tuple, Type
 from itertools import combinations
 
 from .actions import (
@@ -11,26 +10,54 @@ from .actions import (
     TerminalState,
 )
 from .config import BIG_BLIND, STARTING_STACK
-from .evaluate import evaluate
-
-
-class RoundState(
-    namedtuple(
-        "_RoundState",
-        [
-            "button",
-            "street",
-            "pips",
-            "stacks",
-            "hands",
-            "board",
-            "deck",
-            "previous_state",
-        ],
-    )
-):
+from .evaluate import CARD_BITS, HAND_RANKS, ShortDeck, card_mask, evaluate
+
+# legal_actions only ever has four outcomes, so they are shared rather than rebuilt
+_CHECK_ONLY = frozenset({CheckAction})
+_CHECK_OR_RAISE = frozenset({CheckAction, RaiseAction})
+_FOLD_OR_CALL = frozenset({FoldAction, CallAction})
+_FOLD_CALL_OR_RAISE = frozenset({FoldAction, CallAction, RaiseAction})
+
+
+class RoundState:
     """Encodes the game tree for one round of poker."""
 
+    __slots__ = (
+        "button",
+        "street",
+        "pips",
+        "stacks",
+        "hands",
+        "board",
+        "deck",
+        "previous_state",
+        "_legal_actions",
+        "_raise_bounds",
+    )
+
+    def __init__(
+        self,
+        button: int,
+        street: int,
+        pips: Tuple[int, int],
+        stacks: Tuple[int, int],
+        hands: List[List[str]],
+        board: List[str],
+        deck: ShortDeck,
+        previous_state: Optional["RoundState"],
+    ) -> None:
+        self.button = button
+        self.street = street
+        self.pips = pips
+        self.stacks = stacks
+        self.hands = hands
+        self.board = board
+        self.deck = deck
+        self.previous_state = previous_state
+        # states never change once built, so these are filled on first use
+        self._legal_actions = None
+        self._raise_bounds = None
+
     def showdown(self) -> TerminalState:
         """
         Compares the player's hands and computes payoffs.
@@ -38,10 +65,14 @@ class RoundState(
         if len(self.board) < 2: #equity chop ALL IN!
             p0Eq = 0
             comb = 0
-            for combo in combinations(self.deck.cards, 2 - len(self.board)):
-                board = self.board + list(combo)
-                score0 = evaluate(self.hands[0], board)
-                score1 = evaluate(self.hands[1], board)
+            board = card_mask(self.board)
+            hand0 = card_mask(self.hands[0]) | board
+            hand1 = card_mask(self.hands[1]) | board
+            runouts = [CARD_BITS[card] for card in self.deck.remaining()]
+            for combo in combinations(runouts, 2 - len(self.board)):
+                runout = sum(combo)
+                score0 = HAND_RANKS[hand0 | runout]
+                score1 = HAND_RANKS[hand1 | runout]
                 if score0 > score1: p0Eq += 2
                 if score0 == score1: p0Eq += 1
                 comb += 2
@@ -49,51 +80,57 @@ class RoundState(
         else:
             score0 = evaluate(self.hands[0], self.board)
             score1 = evaluate(self.hands[1], self.board)
-            if score0 > score1:
-                delta = STARTING_STACK - self.stacks[1]
-            elif score0 < score1:
-                delta = self.stacks[0] - STARTING_STACK
-            else:  # split the pot
-                delta = (self.stacks[0] - self.stacks[1]) // 2
-        return TerminalState([delta, -delta], self)
-
-    def legal_actions(self) -> Set[Type]:
+            stack0, stack1 = self.stacks
+            # indexed by the comparison: player 0 loses, splits the pot, or wins
+            outcome = (score0 > score1) - (score0 < score1)
+            delta = (
+                stack0 - STARTING_STACK,
+                (stack0 - stack1) // 2,
+                STARTING_STACK - stack1,
+            )[outcome + 1]
+        return TerminalState((delta, -delta), self)
+
+    def legal_actions(self) -> FrozenSet[Type]:
         """
-        Returns a set which corresponds to the active player's legal moves.
+        Returns a frozenset which corresponds to the active player's legal moves.
         """
-        active = self.button % 2
-        continue_cost = self.pips[1 - active] - self.pips[active]
+        if self._legal_actions is None:
+            self._legal_actions = self._compute_legal_actions()
+        return self._legal_actions
+
+    def _compute_legal_actions(self) -> FrozenSet[Type]:
+        active = self.button & 1
+        pips, stacks = self.pips, self.stacks
+        continue_cost = pips[1 - active] - pips[active]
 
         if continue_cost == 0:
             # we can only raise the stakes if both players can afford it
-            bets_forbidden = self.stacks[0] == 0 or self.stacks[1] == 0
-            return {CheckAction} if bets_forbidden else {CheckAction, RaiseAction}
+            bets_forbidden = stacks[0] == 0 or stacks[1] == 0
+            return _CHECK_ONLY if bets_forbidden else _CHECK_OR_RAISE
 
         # If the active player must contribute more chips to continue
-        raises_forbidden = (
-            continue_cost >= self.stacks[active] or self.stacks[1 - active] == 0
-        )
-        return (
-            {FoldAction, CallAction}
-            if raises_forbidden
-            else {FoldAction, CallAction, RaiseAction}
-        )
+        raises_forbidden = continue_cost >= stacks[active] or stacks[1 - active] == 0
+        return _FOLD_OR_CALL if raises_forbidden else _FOLD_CALL_OR_RAISE
 
-    def raise_bounds(self) -> tuple[int, int]:
+    def raise_bounds(self) -> Tuple[int, int]:
         """
         Returns a tuple of the minimum and maximum legal raises.
         """
-        active = self.button % 2
-        continue_cost = self.pips[1 - active] - self.pips[active]
-        max_contribution = min(
-            self.stacks[active], self.stacks[1 - active] + continue_cost
-        )
+        if self._raise_bounds is None:
+            self._raise_bounds = self._compute_raise_bounds()
+        return self._raise_bounds
+
+    def _compute_raise_bounds(self) -> Tuple[int, int]:
+        active = self.button & 1
+        pips, stacks = self.pips, self.stacks
+        continue_cost = pips[1 - active] - pips[active]
+        max_contribution = min(stacks[active], stacks[1 - active] + continue_cost)
         min_contribution = min(
             max_contribution, continue_cost + max(continue_cost, BIG_BLIND)
         )
         return (
-            self.pips[active] + min_contribution,
-            self.pips[active] + max_contribution,
+            pips[active] + min_contribution,
+            pips[active] + max_contribution,
         )
 
     def proceed_street(self) -> "RoundState":
@@ -103,91 +140,84 @@ class RoundState(
         if self.street >= 2 or sum(self.stacks)==0:  # After river, proceed to showdown OR equity chop
             return self.showdown()
 
-        # Dealing the next card (flop or river) and advancing the street
+        # Dealing the next card (flop or river) and advancing the street.
+        # The board is copied so earlier states keep the board they were dealt.
         new_street = self.street + 1
-        if new_street in [1, 2]:  # Dealing a card for flop and river
-            self.board.extend(self.deck.deal(1))
+        board = self.board + self.deck.deal(1)
 
         return RoundState(
-            button=1,
-            street=new_street,
-            pips=[0, 0],  # Resetting the current round's bet amounts
-            stacks=self.stacks,
-            hands=self.hands,
-            board=self.board,
-            deck=self.deck,
-            previous_state=self,
+            1,
+            new_street,
+            (0, 0),  # Resetting the current round's bet amounts
+            self.stacks,
+            self.hands,
+            board,
+            self.deck,
+            self,
         )
 
     def proceed(self, action: Action) -> "RoundState":
         """
         Advances the game tree by one action performed by the active player.
         """
-        active = self.button % 2
-        if isinstance(action, FoldAction):
+        active = self.button & 1
+        kind = type(action)
+        if kind is FoldAction:
             delta = (
                 self.stacks[0] - STARTING_STACK
                 if active == 0
                 else STARTING_STACK - self.stacks[1]
             )
-            return TerminalState([delta, -delta], self)
+            return TerminalState((delta, -delta), self)
 
-        new_pips = list(self.pips)
-        new_stacks = list(self.stacks)
-
-        if isinstance(action, CallAction):
-            if self.button == 0:  # sb calls bb preflop
-                return RoundState(
-                    button=1,
-                    street=0,
-                    pips=[BIG_BLIND] * 2,
-                    stacks=[STARTING_STACK - BIG_BLIND] * 2,
-                    hands=self.hands,
-                    board=self.board,
-                    deck=self.deck,
-                    previous_state=self,
-                )
-            contribution = new_pips[1 - active] - new_pips[active]
-            new_stacks[active] -= contribution
-            new_pips[active] += contribution
-            state = RoundState(
-                button=self.button + 1,
-                street=self.street,
-                pips=new_pips,
-                stacks=new_stacks,
-                hands=self.hands,
-                board=self.board,
-                deck=self.deck,
-                previous_state=self,
-            )
-            return state.proceed_street()
-
-        elif isinstance(action, CheckAction):
+        if kind is CheckAction:
             if (self.street == 0 and self.button > 0) or self.button > 1:
                 # both players acted
                 return self.proceed_street()
             return RoundState(
-                button=self.button + 1,
-                street=self.street,
-                pips=self.pips,
-                stacks=self.stacks,
-                hands=self.hands,
-                board=self.board,
-                deck=self.deck,
-                previous_state=self,
+                self.button + 1,
+                self.street,
+                self.pips,
+                self.stacks,
+                self.hands,
+                self.board,
+                self.deck,
+                self,
             )
 
-        elif isinstance(action, RaiseAction):
-            contribution = action.amount - new_pips[active]
-            new_stacks[active] -= contribution
-            new_pips[active] += contribution
-            return RoundState(
-                button=self.button + 1,
-                street=self.street,
-                pips=new_pips,
-                stacks=new_stacks,
-                hands=self.hands,
-                board=self.board,
-                deck=self.deck,
-                previous_state=self,
-            )
+        if kind is CallAction:
+            if self.button == 0:  # sb calls bb preflop
+                return RoundState(
+                    1,
+                    0,
+                    (BIG_BLIND, BIG_BLIND),
+                    (STARTING_STACK - BIG_BLIND, STARTING_STACK - BIG_BLIND),
+                    self.hands,
+                    self.board,
+                    self.deck,
+                    self,
+                )
+            contribution = self.pips[1 - active] - self.pips[active]
+        else:  # RaiseAction
+            contribution = action.amount - self.pips[active]
+
+        pip0, pip1 = self.pips
+        stack0, stack1 = self.stacks
+        if active:
+            pip1 += contribution
+            stack1 -= contribution
+        else:
+            pip0 += contribution
+            stack0 -= contribution
+        state = RoundState(
+            self.button + 1,
+            self.street,
+            (pip0, pip1),
+            (stack0, stack1),
+            self.hands,
+            self.board,
+            self.deck,
+            self,
+        )
+        # a call closes the betting round, a raise hands the action over
+        return state.proceed_street() if kind is CallAction else state
@@ -117,6 +117,8 @@ class Player(Bot):
         # possible_card_comb = [observation["board_cards"] + list(c) for c in possible_card_comb]
         # result = map(lambda x: evaluate(observation["my_cards"], x[:2]) > evaluate(x[:2], x[2:]), possible_card_comb)
         # prob = sum(result) / len(possible_card_comb)
+        # The exact equity against every opponent hand and runout is also available as a table lookup loop:
+        # from skeleton.evaluate import equity; equity(observation["my_cards"], observation["board_cards"])
 
         # Use pre-computed probability calculation
         equity = self.pre_computed_probs['_'.join(sorted(observation["my_cards"])) + '_' + '_'.join(sorted(observation["board_cards"]))]
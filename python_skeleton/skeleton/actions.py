@@ -11,3 +11,5 @@ CheckAction = namedtuple("CheckAction", [])
 # we coalesce BetAction and RaiseAction for convenience
 RaiseAction = namedtuple("RaiseAction", ["amount"])
 Action = Union[FoldAction, CallAction, CheckAction, RaiseAction]
+# fold, call and check carry no data, so one shared instance of each is reused
+FOLD, CALL, CHECK = FoldAction(), CallAction(), CheckAction()
@@ -9,7 +9,7 @@ import os
 import sys
 from typing import List
 
-from skeleton.actions import Action, FoldAction, CallAction, CheckAction, RaiseAction
+from skeleton.actions import Action, FoldAction, CallAction, CheckAction, RaiseAction, FOLD, CALL, CHECK
 from skeleton.states import (
     GameState,
     RoundState,
@@ -210,11 +210,11 @@ class Runner(PokerBotServicer):
             Action: The converted Action object.
         """
         if proto_action.action == ActionType.FOLD:
-            return FoldAction()
+            return FOLD
         elif proto_action.action == ActionType.CALL:
-            return CallAction()
+            return CALL
         elif proto_action.action == ActionType.CHECK:
-            return CheckAction()
+            return CHECK
         elif proto_action.action == ActionType.RAISE:
             return RaiseAction(proto_action.amount)
 
@@ -0,0 +1,37 @@
+import importlib.util
+import os
+
+from engine import evaluate as engine_evaluate
+
+# bots ship their own copy of the evaluator, which must score hands the same way
+_spec = importlib.util.spec_from_file_location(
+    "skeleton_evaluate",
+    os.path.join(os.path.dirname(__file__), "python_skeleton", "skeleton", "evaluate.py"),
+)
+skeleton_evaluate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(skeleton_evaluate)
+
+# scores from the original evaluator, before showdowns were read from HAND_RANKS
+EXPECTED_SCORES = [
+    (["9s", "9h"], [], 20099),
+    (["1s", "2h"], [], 10021),
+    (["9s", "9h"], ["1d"], 20991),
+    (["5d", "6d"], ["7d"], 50765),
+    (["3s", "8h"], ["4h"], 10843),
+    (["2s", "2h"], ["2d"], 70222),
+]
+
+def test_partial_hands_match_original_scores():
+    for module in (engine_evaluate, skeleton_evaluate):
+        for hand, board, expected in EXPECTED_SCORES:
+            assert module.evaluate(hand, board) == expected, (module.__name__, hand, board)
+
+def test_showdown_hands_match_direct_scoring():
+    for module in (engine_evaluate, skeleton_evaluate):
+        for hand, board in [(["9s", "9h"], ["1d", "9d"]), (["2h", "5h"], ["6h", "7h"])]:
+            assert module.evaluate(hand, board) == module._score(hand + board), (module.__name__, hand, board)
+
+if __name__ == "__main__":
+    test_partial_hands_match_original_scores()
+    test_showdown_hands_match_direct_scoring()
+    print("evaluate OK")